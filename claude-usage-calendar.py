@@ -14,124 +14,598 @@ Usage:
 """
 
 import argparse
-import calendar
+import hashlib
 import json
+import mmap
 import os
-import re
+import pickle
 import subprocess
 import sys
-from collections import defaultdict
-from datetime import datetime, timedelta, timezone
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import date, datetime, timedelta, timezone
+from html import escape
+from itertools import repeat
+
+try:
+    # Optional: orjson parses bytes directly and is several times faster.
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson:
+    json_loads = orjson.loads
+else:
+    try:
+        # Second choice; also takes bytes and beats the stdlib parser.
+        import ujson
+
+        json_loads = ujson.loads
+    except ImportError:
+        json_loads = json.loads
+
+
+# Directories that never hold Claude Code session files but can be huge.
+# Pruning them is what keeps a scan of ~/ fast on a cold filesystem cache.
+SKIP_DIRS = frozenset(
+    {
+        "node_modules",
+        ".git",
+        ".venv",
+        "venv",
+        "__pycache__",
+        ".cache",
+        ".npm",
+        ".cargo",
+        ".Trash",
+        "Library",
+    }
+)
+
+# Digits allowed in session file names (see is_session_file_name)
+HEX_DIGITS = frozenset("0123456789abcdef")
+
+
+def walk_jsonl_files(root):
+    """Yield (name, path) for *.jsonl files under root, without following symlinks.
+
+    Iterative, so only one directory handle is open at a time however deep
+    the tree goes.
+    """
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    name = entry.name
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            # .Trash-<uid> is the per-user trash on other volumes
+                            if name not in SKIP_DIRS and not name.startswith(".Trash-"):
+                                stack.append(entry.path)
+                        elif name.endswith(".jsonl") and entry.is_file(
+                            follow_symlinks=False
+                        ):
+                            yield name, entry.path
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+
+
+def is_session_file_name(name):
+    """Return whether name is <uuid>.jsonl or agent-<hex>.jsonl (lowercase hex).
+
+    Checked structurally rather than with a regex: most names fail on the
+    length or prefix test before any character is examined.
+    """
+    if not name.endswith(".jsonl"):
+        return False
+    stem = name[:-6]
+    if len(stem) == 36:
+        if stem[8] == stem[13] == stem[18] == stem[23] == "-":
+            # Exactly 32 hex digits left means no stray hyphens elsewhere
+            digits = stem.replace("-", "")
+            if len(digits) == 32 and HEX_DIGITS.issuperset(digits):
+                return True
+    if stem.startswith("agent-"):
+        return len(stem) > 6 and HEX_DIGITS.issuperset(stem[6:])
+    return False
 
 
 def find_jsonl_files(search_path="~/"):
     """Find all JSONL files with UUID or agent- pattern names."""
-    result = subprocess.run(
-        ["find", os.path.expanduser(search_path), "-name", "*.jsonl", "-type", "f"],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.DEVNULL,
-        text=True,
-    )
-
     files = []
-    uuid_pattern = re.compile(
-        r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\.jsonl$"
-    )
-    agent_pattern = re.compile(r"agent-[0-9a-f]+\.jsonl$")
 
-    for line in result.stdout.strip().split("\n"):
-        if line:
-            basename = os.path.basename(line)
-            if uuid_pattern.match(basename) or agent_pattern.match(basename):
-                files.append(line)
+    for name, path in walk_jsonl_files(os.path.expanduser(search_path)):
+        if is_session_file_name(name):
+            files.append(path)
 
     return files
 
 
-def parse_jsonl_files(files, tz):
-    """Parse JSONL files and extract usage data, taking MAX values per message ID."""
-    message_data = {}
+def local_date_key(timestamp, tz_offset):
+    """Return the local YYYY-MM-DD date for an ISO-8601 timestamp.
+
+    Claude Code writes fixed-format UTC timestamps ("2025-12-15T03:22:11.123Z",
+    or "+00:00" in place of the "Z"), so the local date is the UTC date shifted
+    by at most one day and can be worked out from string slices without
+    building datetime objects.
+    """
+    if (
+        len(timestamp) >= 20
+        and timestamp[10] == "T"
+        and (timestamp[-1] == "Z" or timestamp.endswith("+00:00"))
+    ):
+        # Building the date also rejects slices that are not a real date
+        day = date(int(timestamp[:4]), int(timestamp[5:7]), int(timestamp[8:10]))
+        hours = int(timestamp[11:13])
+        if not 0 <= hours < 24:
+            raise ValueError(f"hour out of range: {timestamp!r}")
+        seconds = (
+            hours * 3600
+            + int(timestamp[14:16]) * 60
+            + int(timestamp[17:19])
+            + tz_offset
+        )
+        if 0 <= seconds < 86400:
+            return day.isoformat()
+        return (day + timedelta(days=seconds // 86400)).isoformat()
+
+    # Anything else (explicit offsets, no seconds, ...) takes the general path
+    dt = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+    dt_local = dt.astimezone(timezone(timedelta(seconds=tz_offset)))
+    return dt_local.date().isoformat()
+
+
+# Session files are read in chunks of this size and split in memory; most
+# files fit in a single chunk.
+READ_CHUNK_SIZE = 4 * 1024 * 1024
+
+
+def iter_lines(f, chunk_size=READ_CHUNK_SIZE):
+    """Yield the lines of binary file f, without their trailing newlines.
+
+    Large reads split with bytes.split beat readline-style iteration, and
+    only the partial line at the end of each chunk is ever copied again.
+    """
+    pending = b""
+    while True:
+        chunk = f.read(chunk_size)
+        if not chunk:
+            break
+        lines = (pending + chunk if pending else chunk).split(b"\n")
+        pending = lines.pop()
+        yield from lines
+    if pending:
+        yield pending
+
+
+def iter_mapped_lines(mm):
+    """Yield the lines of memory map mm like iter_lines, closing it at the end.
+
+    Used for files too big for one read chunk: each line is sliced straight
+    out of the page cache instead of being buffered and re-joined across
+    chunk boundaries.
+    """
+    with mm:
+        find = mm.find
+        size = len(mm)
+        start = 0
+        while start < size:
+            end = find(b"\n", start)
+            if end < 0:
+                end = size
+            yield mm[start:end]
+            start = end + 1
+
+
+# {tz_offset: {UTC timestamp prefix: local date key}}, shared across files
+DATE_KEY_CACHES = {}
+
+
+def read_usage_records(filepath, tz_offset, message_data):
+    """Read one JSONL file into message_data, taking MAX values per message ID.
+
+    message_data maps msg_id to [date, input, output, cache_read, cache_create].
+    tz_offset is the local UTC offset in seconds; an int rather than a tzinfo
+    so that it is cheap to send to worker processes. Errors reading the file
+    are raised, leaving whatever was read before them in message_data.
+    """
+    # Local aliases: global and attribute lookups add up in the per-line loop
+    loads = json_loads
+    date_key_for = local_date_key
+
+    # Messages cluster in time, so memoize the local date per UTC hour (or
+    # minute/second for offsets that are not whole hours/minutes).
+    date_cache = DATE_KEY_CACHES.setdefault(tz_offset, {})
+    if tz_offset % 3600 == 0:
+        prefix_len = 13
+    elif tz_offset % 60 == 0:
+        prefix_len = 16
+    else:
+        prefix_len = 19
+
+    with open(filepath, "rb") as f:
+        lines = None
+        if os.fstat(f.fileno()).st_size > READ_CHUNK_SIZE:
+            try:
+                lines = iter_mapped_lines(
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                )
+            except (OSError, ValueError):
+                # Not every filesystem can be mapped; read in chunks
+                pass
+        if lines is None:
+            lines = iter_lines(f)
+
+        # The decode-error handler wraps the whole loop rather than each
+        # line; after a malformed line the loop resumes from the next one.
+        while True:
+            try:
+                for line in lines:
+                    # Cheap byte-level rejects before paying for a JSON
+                    # decode: only dated assistant entries carrying usage
+                    # are counted.
+                    if (
+                        not line.startswith(b"{")
+                        or b'"assistant"' not in line
+                        or b'"usage"' not in line
+                        or b'"timestamp"' not in line
+                    ):
+                        continue
+
+                    entry = loads(line)
+
+                    entry_get = entry.get
+                    if entry_get("type") != "assistant":
+                        continue
+
+                    msg = entry_get("message")
+                    if msg is None:
+                        continue
+                    msg_get = msg.get
+                    usage = msg_get("usage")
+                    if not usage:
+                        continue
+
+                    msg_id = msg_get("id")
+                    if not msg_id:
+                        continue
+
+                    timestamp = entry_get("timestamp", "")
+                    if not timestamp:
+                        continue
 
-    for filepath in files:
-        try:
-            with open(filepath, "r") as f:
-                for line in f:
                     try:
-                        entry = json.loads(line.strip())
-
-                        if entry.get("type") == "assistant" and "message" in entry:
-                            msg = entry["message"]
-                            usage = msg.get("usage", {})
-
-                            if not usage:
-                                continue
-
-                            msg_id = msg.get("id", "")
-                            if not msg_id:
-                                continue
-
-                            timestamp = entry.get("timestamp", "")
-                            if not timestamp:
-                                continue
-
-                            try:
-                                dt = datetime.fromisoformat(
-                                    timestamp.replace("Z", "+00:00")
-                                )
-                                dt_local = dt.astimezone(tz)
-                                date_key = dt_local.strftime("%Y-%m-%d")
-                            except Exception:
-                                continue
-
-                            input_t = usage.get("input_tokens", 0)
-                            output_t = usage.get("output_tokens", 0)
-                            cache_r = usage.get("cache_read_input_tokens", 0)
-                            cache_c = usage.get("cache_creation_input_tokens", 0)
-
-                            if msg_id not in message_data:
-                                message_data[msg_id] = {
-                                    "date": date_key,
-                                    "input": input_t,
-                                    "output": output_t,
-                                    "cache_read": cache_r,
-                                    "cache_create": cache_c,
-                                }
-                            else:
-                                message_data[msg_id]["input"] = max(
-                                    message_data[msg_id]["input"], input_t
-                                )
-                                message_data[msg_id]["output"] = max(
-                                    message_data[msg_id]["output"], output_t
-                                )
-                                message_data[msg_id]["cache_read"] = max(
-                                    message_data[msg_id]["cache_read"], cache_r
-                                )
-                                message_data[msg_id]["cache_create"] = max(
-                                    message_data[msg_id]["cache_create"], cache_c
-                                )
-
-                    except json.JSONDecodeError:
+                        if timestamp[-1] == "Z":
+                            prefix = timestamp[:prefix_len]
+                            date_key = date_cache.get(prefix)
+                            if date_key is None:
+                                date_key = date_key_for(timestamp, tz_offset)
+                                date_cache[prefix] = date_key
+                        else:
+                            date_key = date_key_for(timestamp, tz_offset)
+                    except Exception:
                         continue
+
+                    usage_get = usage.get
+                    input_t = usage_get("input_tokens", 0)
+                    output_t = usage_get("output_tokens", 0)
+                    cache_r = usage_get("cache_read_input_tokens", 0)
+                    cache_c = usage_get("cache_creation_input_tokens", 0)
+
+                    record = message_data.get(msg_id)
+                    if record is None:
+                        record = message_data[msg_id] = [date_key, 0, 0, 0, 0]
+                    if input_t > record[1]:
+                        record[1] = input_t
+                    if output_t > record[2]:
+                        record[2] = output_t
+                    if cache_r > record[3]:
+                        record[3] = cache_r
+                    if cache_c > record[4]:
+                        record[4] = cache_c
+                break
+            except ValueError:
+                continue
+
+
+def parse_jsonl_file(filepath, tz_offset):
+    """Parse one JSONL file, taking MAX values per message ID within it.
+
+    Returns {msg_id: [date, input, output, cache_read, cache_create]}. A file
+    that can't be read in full contributes the records read before the error.
+    """
+    message_data = {}
+    try:
+        read_usage_records(filepath, tz_offset, message_data)
+    except Exception:
+        pass
+    return message_data
+
+
+# Parsed per-file records are kept here between runs; old session files never
+# change, so later runs only parse what is new or still being written.
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "claude-usage-calendar")
+
+# Bump when the records read_usage_records produces change shape or meaning
+CACHE_VERSION = 1
+
+
+def cache_entry_name(filepath):
+    """Return the name of filepath's entry in the cache directory."""
+    key = hashlib.blake2b(os.fsencode(filepath), digest_size=16).hexdigest()
+    return key + ".pickle"
+
+
+def parse_jsonl_file_cached(filepath, tz_offset, cache_dir):
+    """parse_jsonl_file, reusing the result of an earlier run when possible.
+
+    Each file's records are pickled to <cache_dir>/<hash of path>.pickle, after
+    a pickled (version, path, mtime, size, tz offset) header, and reused while
+    that header still matches. Cache problems are never fatal; the file is
+    just parsed again.
+    """
+    try:
+        st = os.stat(filepath)
+    except OSError:
+        return {}
+    meta = (CACHE_VERSION, filepath, st.st_mtime_ns, st.st_size, tz_offset)
+    cache_path = os.path.join(cache_dir, cache_entry_name(filepath))
+
+    try:
+        with open(cache_path, "rb") as f:
+            if pickle.load(f) == meta:
+                return pickle.load(f)
+    except Exception:
+        pass
+
+    message_data = {}
+    try:
+        read_usage_records(filepath, tz_offset, message_data)
+    except Exception:
+        # Use what was read, but don't cache it: the error may be a one-off
+        return message_data
+
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        # Write then rename, so a concurrent run never reads a partial entry
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            pickle.dump(meta, f, pickle.HIGHEST_PROTOCOL)
+            pickle.dump(message_data, f, pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+
+    return message_data
+
+
+def prune_cache(cache_dir, files):
+    """Remove cache entries whose session file no longer exists.
+
+    Entries for files in this run are kept unread; for any other entry only
+    its header is loaded, to check the path it was made for.
+    """
+    keep = {cache_entry_name(filepath) for filepath in files}
+    try:
+        names = os.listdir(cache_dir)
+    except OSError:
+        return
+    for name in names:
+        if name in keep or not name.endswith(".pickle"):
+            continue
+        cache_path = os.path.join(cache_dir, name)
+        try:
+            with open(cache_path, "rb") as f:
+                if os.path.exists(pickle.load(f)[1]):
+                    continue
         except Exception:
+            # Unreadable entries are rebuilt if they are ever needed again
+            pass
+        try:
+            os.remove(cache_path)
+        except OSError:
             pass
 
-    daily_usage = defaultdict(
-        lambda: {
-            "input_tokens": 0,
-            "output_tokens": 0,
-            "cache_read_input_tokens": 0,
-            "cache_creation_input_tokens": 0,
-        }
+
+def merge_message_data(message_data, file_data):
+    """Merge one file's records into message_data, taking MAX values per field."""
+    for msg_id, record in file_data.items():
+        current = message_data.get(msg_id)
+        if current is None:
+            message_data[msg_id] = record
+        else:
+            if record[1] > current[1]:
+                current[1] = record[1]
+            if record[2] > current[2]:
+                current[2] = record[2]
+            if record[3] > current[3]:
+                current[3] = record[3]
+            if record[4] > current[4]:
+                current[4] = record[4]
+
+
+class MessageColumns:
+    """Deduplicated per-message usage for the whole history, stored by column.
+
+    Row i is one message: a day id plus its token counts in five parallel
+    int arrays, with index mapping msg_id -> i. Day ids index date_keys, so
+    each date string is stored once rather than once per message. The parent
+    process holds every message at once, and this takes well under half the
+    memory of a list record per message. The token columns become lists if a
+    count won't fit an int64 (a float, say).
+    """
+
+    __slots__ = (
+        "index",
+        "date_ids",
+        "date_keys",
+        "day_ids",
+        "inputs",
+        "outputs",
+        "cache_reads",
+        "cache_creates",
     )
 
-    for msg_id, data in message_data.items():
-        date_key = data["date"]
-        daily_usage[date_key]["input_tokens"] += data["input"]
-        daily_usage[date_key]["output_tokens"] += data["output"]
-        daily_usage[date_key]["cache_read_input_tokens"] += data["cache_read"]
-        daily_usage[date_key]["cache_creation_input_tokens"] += data["cache_create"]
+    def __init__(self):
+        self.index = {}
+        self.date_ids = {}
+        self.date_keys = []
+        self.day_ids = array("i")
+        self.inputs = array("q")
+        self.outputs = array("q")
+        self.cache_reads = array("q")
+        self.cache_creates = array("q")
+
+    def __len__(self):
+        return len(self.day_ids)
+
+    def merge(self, message_data):
+        """Merge {msg_id: [date, ...]} records, taking MAX values per field."""
+        try:
+            self.merge_rows(message_data)
+        except (TypeError, OverflowError):
+            # A count an int64 array can't hold, such as a float: switch the
+            # token columns to lists and merge again. The records merged before
+            # the error are then re-merged as no-op MAX updates.
+            self.widen()
+            self.merge_rows(message_data)
+
+    def widen(self):
+        """Hold the token columns as plain lists, which take any number."""
+        # A row whose token appends failed partway has no day id yet
+        rows = len(self.day_ids)
+        self.inputs = list(self.inputs[:rows])
+        self.outputs = list(self.outputs[:rows])
+        self.cache_reads = list(self.cache_reads[:rows])
+        self.cache_creates = list(self.cache_creates[:rows])
+
+    def merge_rows(self, message_data):
+        """merge, without the fallback for counts the arrays can't hold."""
+        index = self.index
+        date_ids = self.date_ids
+        day_ids = self.day_ids
+        inputs = self.inputs
+        outputs = self.outputs
+        cache_reads = self.cache_reads
+        cache_creates = self.cache_creates
+
+        for msg_id, (
+            date_key,
+            input_t,
+            output_t,
+            cache_r,
+            cache_c,
+        ) in message_data.items():
+            row = index.get(msg_id)
+            if row is None:
+                # Token columns first, so a value that doesn't fit leaves the
+                # row unregistered (see widen)
+                inputs.append(input_t)
+                outputs.append(output_t)
+                cache_reads.append(cache_r)
+                cache_creates.append(cache_c)
+                day_id = date_ids.get(date_key)
+                if day_id is None:
+                    day_id = date_ids[date_key] = len(self.date_keys)
+                    self.date_keys.append(date_key)
+                index[msg_id] = len(day_ids)
+                day_ids.append(day_id)
+            else:
+                if input_t > inputs[row]:
+                    inputs[row] = input_t
+                if output_t > outputs[row]:
+                    outputs[row] = output_t
+                if cache_r > cache_reads[row]:
+                    cache_reads[row] = cache_r
+                if cache_c > cache_creates[row]:
+                    cache_creates[row] = cache_c
+
+
+def parse_one_file(filepath, tz_offset, cache_dir):
+    """Parse one file, through the on-disk cache unless cache_dir is None."""
+    if cache_dir is None:
+        return parse_jsonl_file(filepath, tz_offset)
+    return parse_jsonl_file_cached(filepath, tz_offset, cache_dir)
+
+
+def parse_jsonl_batch(files, tz_offset, cache_dir=None):
+    """Parse a batch of JSONL files in order and return their merged records."""
+    message_data = {}
+    for filepath in files:
+        merge_message_data(message_data, parse_one_file(filepath, tz_offset, cache_dir))
+    return message_data
+
+
+def parse_jsonl_files(files, tz, jobs=None, cache_dir=None):
+    """Parse JSONL files and extract usage data, taking MAX values per message ID.
+
+    Files are parsed in parallel across `jobs` processes (default: CPU count).
+    Each worker merges a contiguous batch of files itself, so the parent only
+    merges a few pre-reduced results; merging in batch order keeps the first
+    date seen for a message the one that wins. With a cache_dir, per-file
+    results are cached there across runs, and entries for files that have
+    since been deleted are removed.
+    """
+    tz_offset = int(tz.utcoffset(None).total_seconds())
+    if jobs is None:
+        jobs = os.cpu_count() or 1
+    messages = None
+
+    if jobs > 1 and len(files) > 1:
+        # A few batches per worker keeps the load balanced across file sizes
+        batch_size = -(-len(files) // (jobs * 4))
+        batches = [files[i : i + batch_size] for i in range(0, len(files), batch_size)]
+        try:
+            messages = MessageColumns()
+            with ProcessPoolExecutor(max_workers=jobs) as executor:
+                for batch_data in executor.map(
+                    parse_jsonl_batch, batches, repeat(tz_offset), repeat(cache_dir)
+                ):
+                    messages.merge(batch_data)
+        except (OSError, NotImplementedError, BrokenProcessPool):
+            # No working process pool here (e.g. no semaphore support in a
+            # sandbox, or a worker was killed): start over in-process.
+            messages = None
+
+    if messages is None:
+        messages = MessageColumns()
+        for filepath in files:
+            messages.merge(parse_one_file(filepath, tz_offset, cache_dir))
+
+    if cache_dir is not None:
+        prune_cache(cache_dir, files)
+
+    # Sum into one flat [input, output, cache_read, cache_create] row per day,
+    # indexed by day id rather than hashed by date string.
+    day_rows = [[0, 0, 0, 0] for _ in messages.date_keys]
+    for day_id, input_t, output_t, cache_r, cache_c in zip(
+        messages.day_ids,
+        messages.inputs,
+        messages.outputs,
+        messages.cache_reads,
+        messages.cache_creates,
+    ):
+        row = day_rows[day_id]
+        row[0] += input_t
+        row[1] += output_t
+        row[2] += cache_r
+        row[3] += cache_c
+
+    daily_usage = {
+        date_key: {
+            "input_tokens": row[0],
+            "output_tokens": row[1],
+            "cache_read_input_tokens": row[2],
+            "cache_creation_input_tokens": row[3],
+        }
+        for date_key, row in zip(messages.date_keys, day_rows)
+    }
 
-    return dict(daily_usage), len(message_data)
+    return daily_usage, len(messages)
 
 
 def format_tokens(n):
@@ -148,17 +622,20 @@ def format_tokens(n):
 def build_usage_data(daily_usage, msg_count, tz_label):
     """Build the canonical JSON data structure from parsed usage data."""
     dates = sorted(daily_usage.keys())
+    # One pass over the days for all four sums
+    input_t = output_t = cache_r = cache_c = 0
+    for usage in daily_usage.values():
+        input_t += usage["input_tokens"]
+        output_t += usage["output_tokens"]
+        cache_r += usage["cache_read_input_tokens"]
+        cache_c += usage["cache_creation_input_tokens"]
     totals = {
-        "input_tokens": sum(d["input_tokens"] for d in daily_usage.values()),
-        "output_tokens": sum(d["output_tokens"] for d in daily_usage.values()),
-        "cache_read_input_tokens": sum(
-            d["cache_read_input_tokens"] for d in daily_usage.values()
-        ),
-        "cache_creation_input_tokens": sum(
-            d["cache_creation_input_tokens"] for d in daily_usage.values()
-        ),
+        "input_tokens": input_t,
+        "output_tokens": output_t,
+        "cache_read_input_tokens": cache_r,
+        "cache_creation_input_tokens": cache_c,
+        "total_tokens": input_t + output_t + cache_r + cache_c,
     }
-    totals["total_tokens"] = sum(totals.values())
 
     return {
         "timezone": tz_label,
@@ -173,69 +650,85 @@ def build_usage_data(daily_usage, msg_count, tz_label):
     }
 
 
-def generate_html(usage_data):
-    """Generate interactive HTML with all views."""
-    # Extract data from the canonical structure
-    daily_usage = usage_data["daily_usage"]
-    tz_label = usage_data["timezone"]
-    date_range = usage_data["date_range"]
+def daily_columns(daily_usage, first_date, last_date):
+    """Lay daily usage out as dense per-token lists for the page.
+
+    Returns [inputs, outputs, cache_reads, cache_creates]; index i is the day
+    i days after first_date, and days without data are 0. Plain integers
+    carry no per-day keys, so this is far smaller than daily_usage as JSON.
+    """
+    start = date.fromisoformat(first_date)
+    num_days = (date.fromisoformat(last_date) - start).days + 1
+    columns = [[0] * num_days for _ in range(4)]
+    inputs, outputs, cache_reads, cache_creates = columns
+    for date_key, usage in daily_usage.items():
+        i = (date.fromisoformat(date_key) - start).days
+        inputs[i] = usage["input_tokens"]
+        outputs[i] = usage["output_tokens"]
+        cache_reads[i] = usage["cache_read_input_tokens"]
+        cache_creates[i] = usage["cache_creation_input_tokens"]
+    return columns
+
+
+def monthly_usage(daily_usage):
+    """Roll daily usage up into {YYYY-MM: usage} for the page's month views."""
+    month_rows = {date_key[:7]: [0, 0, 0, 0] for date_key in daily_usage}
+    for date_key, usage in daily_usage.items():
+        row = month_rows[date_key[:7]]
+        row[0] += usage["input_tokens"]
+        row[1] += usage["output_tokens"]
+        row[2] += usage["cache_read_input_tokens"]
+        row[3] += usage["cache_creation_input_tokens"]
 
-    # Convert daily_usage to JSON for embedding
-    daily_data_json = json.dumps(daily_usage)
+    return {
+        month: {
+            "input_tokens": row[0],
+            "output_tokens": row[1],
+            "cache_read_input_tokens": row[2],
+            "cache_creation_input_tokens": row[3],
+        }
+        for month, row in month_rows.items()
+    }
 
-    # Find date range
-    if date_range["start"]:
-        min_date = date_range["start"]
-        max_date = date_range["end"]
-        min_year = int(min_date[:4])
-        max_year = int(max_date[:4])
-    else:
-        now = datetime.now()
-        min_year = max_year = now.year
-        min_date = max_date = now.strftime("%Y-%m-%d")
 
-    html = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Claude Code Token Usage</title>
-    <style>
-        * {{
+# Static page assets. They live outside the f-strings in write_html so their
+# braces need no escaping; only the data and a few values are interpolated.
+HTML_STYLE = """\
+        * {
             margin: 0;
             padding: 0;
             box-sizing: border-box;
-        }}
+        }
 
-        html {{
+        html {
             background: #0a0818;
-        }}
+        }
 
-        body {{
+        body {
             font-family: 'SF Pro Display', -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
             background: linear-gradient(135deg, #0f0c29 0%, #1a1a3e 50%, #24243e 100%);
             min-height: 100vh;
             padding: 20px;
             color: #e0e0e0;
-        }}
+        }
 
-        .container {{
+        .container {
             max-width: 1400px;
             margin: 0 auto;
-        }}
+        }
 
-        .header-bar {{
+        .header-bar {
             display: grid;
             grid-template-columns: 1fr auto 1fr;
             align-items: center;
             margin-bottom: 15px;
-        }}
+        }
 
-        .header-bar .tz-label {{
+        .header-bar .tz-label {
             text-align: right;
-        }}
+        }
 
-        h1 {{
+        h1 {
             font-size: 1.6rem;
             font-weight: 700;
             background: linear-gradient(90deg, #00d4ff, #00ff88, #00d4ff);
@@ -245,26 +738,26 @@ def generate_html(usage_data):
             background-clip: text;
             animation: gradient 3s linear infinite;
             margin: 0;
-        }}
+        }
 
-        .tz-label {{
+        .tz-label {
             color: #666;
             font-size: 0.8rem;
-        }}
+        }
 
-        @keyframes gradient {{
-            0% {{ background-position: 0% center; }}
-            100% {{ background-position: 200% center; }}
-        }}
+        @keyframes gradient {
+            0% { background-position: 0% center; }
+            100% { background-position: 200% center; }
+        }
 
         /* Navigation Tabs */
-        .nav-tabs {{
+        .nav-tabs {
             display: flex;
             justify-content: center;
             gap: 8px;
-        }}
+        }
 
-        .nav-tab {{
+        .nav-tab {
             padding: 8px 18px;
             background: rgba(40, 40, 80, 0.5);
             border: 1px solid rgba(255, 255, 255, 0.1);
@@ -274,29 +767,29 @@ def generate_html(usage_data):
             font-size: 0.85rem;
             font-weight: 500;
             transition: all 0.3s ease;
-        }}
+        }
 
-        .nav-tab:hover {{
+        .nav-tab:hover {
             background: rgba(60, 60, 100, 0.6);
             color: #fff;
-        }}
+        }
 
-        .nav-tab.active {{
+        .nav-tab.active {
             background: linear-gradient(135deg, rgba(0, 212, 255, 0.3) 0%, rgba(0, 255, 136, 0.2) 100%);
             border-color: rgba(0, 212, 255, 0.5);
             color: #00d4ff;
-        }}
+        }
 
         /* Sub Navigation */
-        .sub-nav {{
+        .sub-nav {
             display: flex;
             justify-content: center;
             align-items: center;
             gap: 15px;
             margin-bottom: 15px;
-        }}
+        }
 
-        .nav-arrow {{
+        .nav-arrow {
             padding: 5px 12px;
             background: rgba(40, 40, 80, 0.5);
             border: 1px solid rgba(255, 255, 255, 0.1);
@@ -305,53 +798,53 @@ def generate_html(usage_data):
             cursor: pointer;
             font-size: 1rem;
             transition: all 0.3s ease;
-        }}
+        }
 
-        .nav-arrow:hover:not(.disabled) {{
+        .nav-arrow:hover:not(.disabled) {
             background: rgba(60, 60, 100, 0.6);
             color: #00d4ff;
             border-color: rgba(0, 212, 255, 0.3);
-        }}
+        }
 
-        .nav-arrow.disabled {{
+        .nav-arrow.disabled {
             opacity: 0.3;
             cursor: not-allowed;
-        }}
+        }
 
-        .nav-current {{
+        .nav-current {
             font-size: 1.1rem;
             font-weight: 600;
             color: #fff;
             min-width: 160px;
             text-align: center;
-        }}
+        }
 
         /* Content area */
-        .view-content {{
+        .view-content {
             display: none;
-        }}
+        }
 
-        .view-content.active {{
+        .view-content.active {
             display: block;
-        }}
+        }
 
-        .calendar {{
+        .calendar {
             background: rgba(30, 30, 60, 0.6);
             border-radius: 20px;
             padding: 30px;
             backdrop-filter: blur(10px);
             border: 1px solid rgba(255, 255, 255, 0.1);
             box-shadow: 0 20px 60px rgba(0, 0, 0, 0.5);
-        }}
+        }
 
-        .calendar-header {{
+        .calendar-header {
             display: grid;
             grid-template-columns: repeat(7, 1fr) 120px;
             gap: 10px;
             margin-bottom: 15px;
-        }}
+        }
 
-        .header-cell {{
+        .header-cell {
             text-align: center;
             font-weight: 600;
             font-size: 0.9rem;
@@ -359,16 +852,16 @@ def generate_html(usage_data):
             text-transform: uppercase;
             letter-spacing: 1px;
             padding: 10px;
-        }}
+        }
 
-        .week-row {{
+        .week-row {
             display: grid;
             grid-template-columns: repeat(7, 1fr) 120px;
             gap: 10px;
             margin-bottom: 10px;
-        }}
+        }
 
-        .day-cell {{
+        .day-cell {
             background: rgba(40, 40, 80, 0.5);
             border-radius: 8px;
             padding: 6px 8px;
@@ -377,41 +870,47 @@ def generate_html(usage_data):
             border: 1px solid rgba(255, 255, 255, 0.05);
             position: relative;
             overflow: hidden;
-        }}
+        }
 
-        .day-cell:hover {{
+        .day-cell:hover {
             transform: translateY(-2px);
             box-shadow: 0 8px 25px rgba(0, 212, 255, 0.2);
             border-color: rgba(0, 212, 255, 0.3);
-        }}
+        }
 
-        .day-cell.empty {{
+        .day-cell.empty {
             background: rgba(20, 20, 40, 0.3);
             border: none;
-        }}
+        }
 
-        .day-cell.empty:hover {{
+        .day-cell.empty:hover {
             transform: none;
             box-shadow: none;
-        }}
+        }
 
-        .day-cell.other-month {{
+        .day-cell.other-month {
             opacity: 0.7;
-        }}
+        }
 
-        .day-cell.other-month .day-total,
-        .day-cell.other-month .day-breakdown span {{
+        .day-cell.other-month .day-total {
             color: #777 !important;
-        }}
+        }
+
+        /* Breakdowns are only filled in for this month's days with usage;
+           the rest hold blank lines, so every cell stays the same size */
+        .day-cell.no-usage .day-breakdown,
+        .day-cell.other-month .day-breakdown {
+            visibility: hidden;
+        }
 
-        .day-cell.other-month .day-number {{
+        .day-cell.other-month .day-number {
             background: rgba(255, 255, 255, 0.05);
             border-color: rgba(255, 255, 255, 0.1);
             color: #777;
-        }}
+        }
 
         /* Keyboard shortcuts modal */
-        .modal-overlay {{
+        .modal-overlay {
             display: none;
             position: fixed;
             top: 0;
@@ -422,36 +921,36 @@ def generate_html(usage_data):
             z-index: 1000;
             justify-content: center;
             align-items: center;
-        }}
+        }
 
-        .modal-overlay.active {{
+        .modal-overlay.active {
             display: flex;
-        }}
+        }
 
-        .modal {{
+        .modal {
             background: linear-gradient(135deg, #1a1a3e 0%, #24243e 100%);
             border: 1px solid rgba(0, 212, 255, 0.3);
             border-radius: 16px;
             padding: 30px;
             max-width: 400px;
             box-shadow: 0 20px 60px rgba(0, 0, 0, 0.5);
-        }}
+        }
 
-        .modal h3 {{
+        .modal h3 {
             color: #00d4ff;
             font-size: 1.1rem;
             margin-bottom: 5px;
             text-align: center;
-        }}
+        }
 
-        .modal-hint {{
+        .modal-hint {
             text-align: center;
             color: #666;
             font-size: 0.8rem;
             margin-bottom: 15px;
-        }}
+        }
 
-        kbd {{
+        kbd {
             background: rgba(0, 212, 255, 0.15);
             border: 1px solid rgba(0, 212, 255, 0.4);
             border-radius: 4px;
@@ -462,39 +961,39 @@ def generate_html(usage_data):
             display: inline-block;
             min-width: 24px;
             text-align: center;
-        }}
+        }
 
-        .modal-divider {{
+        .modal-divider {
             height: 1px;
             background: rgba(255, 255, 255, 0.1);
             margin: 15px 0;
-        }}
+        }
 
-        .shortcut-table {{
+        .shortcut-table {
             width: 100%;
             border-collapse: collapse;
-        }}
+        }
 
-        .shortcut-table tr {{
+        .shortcut-table tr {
             border-bottom: 1px solid rgba(255, 255, 255, 0.05);
-        }}
+        }
 
-        .shortcut-table tr:last-child {{
+        .shortcut-table tr:last-child {
             border-bottom: none;
-        }}
+        }
 
-        .shortcut-table td {{
+        .shortcut-table td {
             padding: 8px 0;
             color: #aaa;
             font-size: 0.9rem;
-        }}
+        }
 
-        .shortcut-table td:first-child {{
+        .shortcut-table td:first-child {
             width: 90px;
             padding-right: 15px;
-        }}
+        }
 
-        .protip {{
+        .protip {
             position: fixed;
             top: 20px;
             right: 20px;
@@ -506,23 +1005,23 @@ def generate_html(usage_data):
             color: #888;
             z-index: 100;
             transition: opacity 0.3s ease;
-        }}
+        }
 
-        .protip kbd {{
+        .protip kbd {
             background: rgba(0, 212, 255, 0.2);
             border: 1px solid rgba(0, 212, 255, 0.4);
             border-radius: 4px;
             padding: 2px 6px;
             font-family: monospace;
             color: #00d4ff;
-        }}
+        }
 
-        .protip.hidden {{
+        .protip.hidden {
             opacity: 0;
             pointer-events: none;
-        }}
+        }
 
-        .github-link {{
+        .github-link {
             display: flex;
             align-items: center;
             justify-content: center;
@@ -532,32 +1031,32 @@ def generate_html(usage_data):
             font-size: 0.8rem;
             transition: color 0.2s ease;
             margin-top: 15px;
-        }}
+        }
 
-        .github-link:hover {{
+        .github-link:hover {
             color: #00d4ff;
-        }}
+        }
 
-        .github-link svg {{
+        .github-link svg {
             width: 18px;
             height: 18px;
             fill: currentColor;
-        }}
+        }
 
-        .day-header {{
+        .day-header {
             display: flex;
             justify-content: space-between;
             align-items: baseline;
             margin-bottom: 3px;
-        }}
+        }
 
-        .day-total {{
+        .day-total {
             font-size: 1rem;
             font-weight: 700;
             color: #00d4ff;
-        }}
+        }
 
-        .day-number {{
+        .day-number {
             font-size: 0.75rem;
             font-weight: 600;
             color: #fff;
@@ -567,23 +1066,23 @@ def generate_html(usage_data):
             padding: 2px 6px;
             min-width: 22px;
             text-align: center;
-        }}
+        }
 
-        .day-breakdown {{
+        .day-breakdown {
             display: grid;
             grid-template-columns: 1fr 1fr;
             gap: 1px 6px;
             font-size: 0.6rem;
             color: #888;
             line-height: 1.2;
-        }}
+        }
 
-        .in-label {{ color: #4ade80; }}
-        .out-label {{ color: #f472b6; }}
-        .cache-r-label {{ color: #fbbf24; }}
-        .cache-c-label {{ color: #a78bfa; }}
+        .in-label { color: #4ade80; }
+        .out-label { color: #f472b6; }
+        .cache-r-label { color: #fbbf24; }
+        .cache-c-label { color: #a78bfa; }
 
-        .week-total {{
+        .week-total {
             background: rgba(0, 212, 255, 0.1);
             border-radius: 12px;
             padding: 12px;
@@ -592,56 +1091,56 @@ def generate_html(usage_data):
             justify-content: center;
             align-items: center;
             border: 1px solid rgba(0, 212, 255, 0.2);
-        }}
+        }
 
-        .week-total-label {{
+        .week-total-label {
             font-size: 0.7rem;
             color: #888;
             text-transform: uppercase;
             letter-spacing: 1px;
             margin-bottom: 5px;
-        }}
+        }
 
-        .week-total-value {{
+        .week-total-value {
             font-size: 1.2rem;
             font-weight: 700;
             color: #00d4ff;
-        }}
+        }
 
-        .summary {{
+        .summary {
             margin-top: 20px;
             background: linear-gradient(135deg, rgba(0, 212, 255, 0.1) 0%, rgba(0, 255, 136, 0.1) 100%);
             border-radius: 12px;
             padding: 15px 20px;
             border: 1px solid rgba(0, 212, 255, 0.2);
-        }}
+        }
 
-        .summary h2 {{
+        .summary h2 {
             font-size: 1.2rem;
             font-weight: 600;
             color: #fff;
             margin-bottom: 20px;
             text-align: center;
-        }}
+        }
 
-        .summary-row {{
+        .summary-row {
             display: flex;
             justify-content: flex-start;
             align-items: center;
             gap: 12px;
             flex-wrap: wrap;
-        }}
+        }
 
-        .summary-title {{
+        .summary-title {
             font-size: 0.85rem;
             font-weight: 600;
             color: #888;
             text-transform: uppercase;
             letter-spacing: 1px;
             margin-right: 8px;
-        }}
+        }
 
-        .summary-inline {{
+        .summary-inline {
             display: flex;
             align-items: baseline;
             gap: 8px;
@@ -649,375 +1148,357 @@ def generate_html(usage_data):
             border: 1px solid rgba(255, 255, 255, 0.1);
             border-radius: 8px;
             padding: 8px 14px;
-        }}
+        }
 
-        .summary-grid {{
+        .summary-grid {
             display: grid;
             grid-template-columns: repeat(5, 1fr);
             gap: 20px;
-        }}
+        }
 
-        .summary-item {{
+        .summary-item {
             text-align: center;
             padding: 15px;
             background: rgba(0, 0, 0, 0.2);
             border-radius: 12px;
-        }}
+        }
 
-        .summary-label {{
+        .summary-label {
             font-size: 0.75rem;
             color: #888;
             text-transform: uppercase;
             letter-spacing: 1px;
             margin-bottom: 8px;
-        }}
+        }
 
-        .summary-label-inline {{
+        .summary-label-inline {
             font-size: 0.8rem;
             color: #888;
-        }}
+        }
 
-        .summary-value {{
+        .summary-value {
             font-size: 1.5rem;
             font-weight: 700;
-        }}
+        }
 
-        .summary-value.input {{ color: #4ade80; }}
-        .summary-value.output {{ color: #f472b6; }}
-        .summary-value.cache-read {{ color: #fbbf24; }}
-        .summary-value.cache-create {{ color: #a78bfa; }}
-        .summary-value.total {{
+        .summary-value.input { color: #4ade80; }
+        .summary-value.output { color: #f472b6; }
+        .summary-value.cache-read { color: #fbbf24; }
+        .summary-value.cache-create { color: #a78bfa; }
+        .summary-value.total {
             background: linear-gradient(90deg, #00d4ff, #00ff88);
             -webkit-background-clip: text;
             -webkit-text-fill-color: transparent;
             background-clip: text;
-        }}
+        }
 
-        .intensity-low {{ background: rgba(40, 40, 80, 0.5); }}
-        .intensity-1 {{ background: linear-gradient(135deg, rgba(0, 80, 100, 0.6) 0%, rgba(40, 40, 80, 0.5) 100%); }}
-        .intensity-2 {{ background: linear-gradient(135deg, rgba(0, 120, 130, 0.6) 0%, rgba(40, 60, 90, 0.5) 100%); }}
-        .intensity-3 {{ background: linear-gradient(135deg, rgba(0, 160, 160, 0.7) 0%, rgba(40, 80, 100, 0.5) 100%); }}
-        .intensity-4 {{ background: linear-gradient(135deg, rgba(0, 200, 180, 0.7) 0%, rgba(40, 100, 110, 0.5) 100%); }}
-        .intensity-5 {{ background: linear-gradient(135deg, rgba(0, 212, 255, 0.8) 0%, rgba(0, 180, 150, 0.6) 100%); }}
+        .intensity-low { background: rgba(40, 40, 80, 0.5); }
+        .intensity-1 { background: linear-gradient(135deg, rgba(0, 80, 100, 0.6) 0%, rgba(40, 40, 80, 0.5) 100%); }
+        .intensity-2 { background: linear-gradient(135deg, rgba(0, 120, 130, 0.6) 0%, rgba(40, 60, 90, 0.5) 100%); }
+        .intensity-3 { background: linear-gradient(135deg, rgba(0, 160, 160, 0.7) 0%, rgba(40, 80, 100, 0.5) 100%); }
+        .intensity-4 { background: linear-gradient(135deg, rgba(0, 200, 180, 0.7) 0%, rgba(40, 100, 110, 0.5) 100%); }
+        .intensity-5 { background: linear-gradient(135deg, rgba(0, 212, 255, 0.8) 0%, rgba(0, 180, 150, 0.6) 100%); }
 
         /* Yearly View */
-        .year-grid {{
+        .year-grid {
             display: grid;
             grid-template-columns: repeat(4, 1fr);
             gap: 20px;
             margin-bottom: 30px;
-        }}
+        }
 
-        .month-card {{
+        .month-card {
             background: rgba(40, 40, 80, 0.5);
             border-radius: 16px;
             padding: 20px;
             border: 1px solid rgba(255, 255, 255, 0.05);
             cursor: pointer;
             transition: all 0.3s ease;
-        }}
+        }
 
-        .month-card:hover {{
+        .month-card:hover {
             transform: translateY(-5px);
             box-shadow: 0 15px 40px rgba(0, 212, 255, 0.25);
             border-color: rgba(0, 212, 255, 0.4);
-        }}
+        }
 
-        .month-card.no-data {{
+        .month-card.no-data {
             opacity: 0.4;
             cursor: default;
-        }}
+        }
 
-        .month-card.no-data:hover {{
+        .month-card.no-data:hover {
             transform: none;
             box-shadow: none;
             border-color: rgba(255, 255, 255, 0.05);
-        }}
+        }
 
-        .month-name {{
+        .month-name {
             font-size: 1.1rem;
             font-weight: 600;
             color: #fff;
             margin-bottom: 12px;
-        }}
+        }
 
-        .month-total {{
+        .month-total {
             font-size: 1.8rem;
             font-weight: 700;
             color: #00d4ff;
             margin-bottom: 10px;
-        }}
+        }
 
-        .month-breakdown {{
+        .month-breakdown {
             font-size: 0.75rem;
             color: #888;
             line-height: 1.6;
-        }}
+        }
 
         /* All Time View */
-        .all-time-header {{
+        .all-time-header {
             text-align: center;
             margin-bottom: 25px;
-        }}
+        }
 
-        .all-time-date-range {{
+        .all-time-date-range {
             font-size: 1.2rem;
             font-weight: 600;
             color: #fff;
             margin-bottom: 5px;
-        }}
+        }
 
-        .all-time-days-count {{
+        .all-time-days-count {
             font-size: 0.9rem;
             color: #888;
-        }}
+        }
 
-        .all-time-stats {{
+        .all-time-stats {
             display: grid;
             grid-template-columns: repeat(3, 1fr);
             gap: 20px;
             margin-bottom: 20px;
-        }}
+        }
 
-        .all-time-breakdown {{
+        .all-time-breakdown {
             display: grid;
             grid-template-columns: repeat(2, 1fr);
             gap: 20px;
             margin-bottom: 20px;
-        }}
+        }
 
-        .stat-card {{
+        .stat-card {
             background: rgba(40, 40, 80, 0.5);
             border-radius: 16px;
             padding: 25px;
             text-align: center;
             border: 1px solid rgba(255, 255, 255, 0.05);
-        }}
+        }
 
-        .stat-label {{
+        .stat-label {
             font-size: 0.85rem;
             color: #888;
             text-transform: uppercase;
             letter-spacing: 1px;
             margin-bottom: 10px;
-        }}
+        }
 
-        .stat-value {{
+        .stat-value {
             font-size: 2rem;
             font-weight: 700;
-        }}
+        }
 
-        .stat-value.highlight {{
+        .stat-value.highlight {
             background: linear-gradient(90deg, #00d4ff, #00ff88);
             -webkit-background-clip: text;
             -webkit-text-fill-color: transparent;
             background-clip: text;
-        }}
+        }
 
-        .token-breakdown {{
+        .token-breakdown {
             display: grid;
             grid-template-columns: repeat(4, 1fr);
             gap: 20px;
-        }}
+        }
 
-        .token-card {{
+        .token-card {
             background: rgba(40, 40, 80, 0.5);
             border-radius: 16px;
             padding: 25px;
             text-align: center;
             border: 1px solid rgba(255, 255, 255, 0.05);
-        }}
+        }
 
-        .token-card-label {{
+        .token-card-label {
             font-size: 0.85rem;
             color: #888;
             text-transform: uppercase;
             letter-spacing: 1px;
             margin-bottom: 10px;
-        }}
+        }
 
-        .token-card-value {{
+        .token-card-value {
             font-size: 2.2rem;
             font-weight: 700;
-        }}
+        }
 
-        .token-card-pct {{
+        .token-card-pct {
             font-size: 0.9rem;
             color: #666;
             margin-top: 8px;
-        }}
-    </style>
-</head>
-<body>
-    <div class="protip" id="protip">protip: press <kbd>?</kbd> for keyboard shortcuts</div>
-    <div class="container">
-        <div class="header-bar">
-            <h1>Claude Code Token Usage</h1>
-            <div class="nav-tabs">
-                <div class="nav-tab active" data-view="monthly">📆 Monthly</div>
-                <div class="nav-tab" data-view="yearly">📅 Yearly</div>
-                <div class="nav-tab" data-view="alltime">📊 All Time</div>
-            </div>
-            <div class="tz-label">{tz_label}</div>
-        </div>
-
-        <div class="sub-nav" id="sub-nav" style="display: none;">
-            <div class="nav-arrow" id="nav-prev">◀</div>
-            <div class="nav-current" id="nav-current"></div>
-            <div class="nav-arrow" id="nav-next">▶</div>
-        </div>
-
-        <div class="view-content" id="view-alltime">
-            <div class="calendar">
-                <div class="all-time-header" id="all-time-header"></div>
-                <div class="all-time-stats" id="all-time-stats"></div>
-                <div class="summary" id="all-time-summary"></div>
-            </div>
-        </div>
-
-        <div class="view-content" id="view-yearly">
-            <div class="calendar">
-                <div class="year-grid" id="year-grid"></div>
-                <div class="summary" id="year-summary"></div>
-            </div>
-        </div>
-
-        <div class="view-content active" id="view-monthly">
-            <div class="calendar" id="monthly-calendar"></div>
-        </div>
-    </div>
-
-    <div class="modal-overlay" id="help-modal">
-        <div class="modal">
-            <h3>Keyboard Shortcuts</h3>
-            <div class="modal-hint">press esc to close</div>
-            <div class="modal-divider"></div>
-            <table class="shortcut-table">
-                <tr><td><kbd>1</kbd></td><td>Monthly view</td></tr>
-                <tr><td><kbd>2</kbd></td><td>Yearly view</td></tr>
-                <tr><td><kbd>3</kbd></td><td>All Time view</td></tr>
-                <tr><td><kbd>h</kbd> / <kbd>k</kbd></td><td>Previous (month/year)</td></tr>
-                <tr><td><kbd>j</kbd> / <kbd>l</kbd></td><td>Next (month/year)</td></tr>
-                <tr><td><kbd>c</kbd></td><td>Current month</td></tr>
-                <tr><td><kbd>?</kbd></td><td>Show this help</td></tr>
-            </table>
-            <div class="modal-divider"></div>
-            <a href="https://github.com/rickgorman/claude-usage-calendar" target="_blank" class="github-link">
-                <svg viewBox="0 0 16 16"><path d="M8 0C3.58 0 0 3.58 0 8c0 3.54 2.29 6.53 5.47 7.59.4.07.55-.17.55-.38 0-.19-.01-.82-.01-1.49-2.01.37-2.53-.49-2.69-.94-.09-.23-.48-.94-.82-1.13-.28-.15-.68-.52-.01-.53.63-.01 1.08.58 1.23.82.72 1.21 1.87.87 2.33.66.07-.52.28-.87.51-1.07-1.78-.2-3.64-.89-3.64-3.95 0-.87.31-1.59.82-2.15-.08-.2-.36-1.02.08-2.12 0 0 .67-.21 2.2.82.64-.18 1.32-.27 2-.27.68 0 1.36.09 2 .27 1.53-1.04 2.2-.82 2.2-.82.44 1.1.16 1.92.08 2.12.51.56.82 1.27.82 2.15 0 3.07-1.87 3.75-3.65 3.95.29.25.54.73.54 1.48 0 1.07-.01 1.93-.01 2.2 0 .21.15.46.55.38A8.013 8.013 0 0016 8c0-4.42-3.58-8-8-8z"/></svg>
-                rickgorman/claude-usage-calendar
-            </a>
-        </div>
-    </div>
+        }
+"""
 
-    <script>
-        const dailyData = {daily_data_json};
-        const minYear = {min_year};
-        const maxYear = {max_year};
+HTML_SCRIPT = """\
         const monthNames = ['January', 'February', 'March', 'April', 'May', 'June',
                            'July', 'August', 'September', 'October', 'November', 'December'];
+        const emptyUsage = { input_tokens: 0, output_tokens: 0, cache_read_input_tokens: 0, cache_creation_input_tokens: 0 };
+        // '01'..'31', for building date keys without padStart per lookup
+        const dayPad = Array.from({ length: 31 }, (_, i) => String(i + 1).padStart(2, '0'));
+
+        // Elements the views update, looked up once
+        const navCurrent = document.getElementById('nav-current');
+        const navPrev = document.getElementById('nav-prev');
+        const navNext = document.getElementById('nav-next');
+        const subNav = document.getElementById('sub-nav');
+        const yearGrid = document.getElementById('year-grid');
+        const yearSummary = document.getElementById('year-summary');
+        const monthlyCalendar = document.getElementById('monthly-calendar');
+        const navTabs = document.querySelectorAll('.nav-tab');
+        const viewContents = document.querySelectorAll('.view-content');
 
         let currentView = 'alltime';
+        // Start on the latest month with data
         let currentYear = maxYear;
-        let currentMonth = new Date().getMonth() + 1;
-
-        // Find latest month with data
-        const dates = Object.keys(dailyData).sort();
-        if (dates.length > 0) {{
-            const latestDate = dates[dates.length - 1];
-            currentYear = parseInt(latestDate.substring(0, 4));
-            currentMonth = parseInt(latestDate.substring(5, 7));
-        }}
+        let currentMonth = latestMonth;
+
+        // Renders format the same values again and again (repeated subtotals,
+        // every revisit of a month), so results are memoized up to a cap.
+        const formattedTokens = new Map();
+
+        function formatTokens(n) {
+            // Empty days are the most common value; skip the threshold ladder
+            if (n === 0) return '0';
+            let s = formattedTokens.get(n);
+            if (s === undefined) {
+                s = formatTokenCount(n);
+                if (formattedTokens.size < 4096) formattedTokens.set(n, s);
+            }
+            return s;
+        }
 
-        function formatTokens(n) {{
+        function formatTokenCount(n) {
             if (n >= 1e9) return (n / 1e9).toFixed(1) + 'B';
             if (n >= 1e6) return (n / 1e6).toFixed(1) + 'M';
             if (n >= 1e3) return (n / 1e3).toFixed(1) + 'K';
             return n.toString();
-        }}
+        }
 
-        function getTotal(usage) {{
+        function getTotal(usage) {
             return (usage.input_tokens || 0) + (usage.output_tokens || 0) +
                    (usage.cache_read_input_tokens || 0) + (usage.cache_creation_input_tokens || 0);
-        }}
-
-        function aggregateByMonth(year, month) {{
-            const prefix = `${{year}}-${{String(month).padStart(2, '0')}}`;
-            const result = {{ input_tokens: 0, output_tokens: 0, cache_read_input_tokens: 0, cache_creation_input_tokens: 0 }};
-            for (const [date, usage] of Object.entries(dailyData)) {{
-                if (date.startsWith(prefix)) {{
-                    result.input_tokens += usage.input_tokens || 0;
-                    result.output_tokens += usage.output_tokens || 0;
-                    result.cache_read_input_tokens += usage.cache_read_input_tokens || 0;
-                    result.cache_creation_input_tokens += usage.cache_creation_input_tokens || 0;
-                }}
-            }}
-            return result;
-        }}
-
-        function aggregateByYear(year) {{
-            const prefix = `${{year}}-`;
-            const result = {{ input_tokens: 0, output_tokens: 0, cache_read_input_tokens: 0, cache_creation_input_tokens: 0 }};
-            for (const [date, usage] of Object.entries(dailyData)) {{
-                if (date.startsWith(prefix)) {{
-                    result.input_tokens += usage.input_tokens || 0;
-                    result.output_tokens += usage.output_tokens || 0;
-                    result.cache_read_input_tokens += usage.cache_read_input_tokens || 0;
-                    result.cache_creation_input_tokens += usage.cache_creation_input_tokens || 0;
-                }}
-            }}
-            return result;
-        }}
-
-        function aggregateAllTime() {{
-            const result = {{ input_tokens: 0, output_tokens: 0, cache_read_input_tokens: 0, cache_creation_input_tokens: 0 }};
-            for (const usage of Object.values(dailyData)) {{
-                result.input_tokens += usage.input_tokens || 0;
-                result.output_tokens += usage.output_tokens || 0;
-                result.cache_read_input_tokens += usage.cache_read_input_tokens || 0;
-                result.cache_creation_input_tokens += usage.cache_creation_input_tokens || 0;
-            }}
-            return result;
-        }}
-
-        function renderAllTime() {{
+        }
+
+        // Month rollups are precomputed in Python (monthlyData); year and
+        // all-time totals are summed from them once, as the data never changes
+        // after load. The monthly view doesn't need them, so that pass runs
+        // when the browser is idle after first paint, or on first use.
+        function addUsage(result, usage) {
+            result.input_tokens += usage.input_tokens || 0;
+            result.output_tokens += usage.output_tokens || 0;
+            result.cache_read_input_tokens += usage.cache_read_input_tokens || 0;
+            result.cache_creation_input_tokens += usage.cache_creation_input_tokens || 0;
+        }
+
+        let yearlyTotals = null;
+        let allTimeTotals = null;
+
+        function buildRollupTotals() {
+            if (yearlyTotals) return;
+            yearlyTotals = {};
+            allTimeTotals = { ...emptyUsage };
+            for (const [month, usage] of Object.entries(monthlyData)) {
+                const year = month.substring(0, 4);
+                if (!(year in yearlyTotals)) yearlyTotals[year] = { ...emptyUsage };
+                addUsage(yearlyTotals[year], usage);
+                addUsage(allTimeTotals, usage);
+            }
+        }
+
+        function aggregateByMonth(year, month) {
+            return monthlyData[`${year}-${dayPad[month-1]}`] || emptyUsage;
+        }
+
+        function aggregateByYear(year) {
+            buildRollupTotals();
+            return yearlyTotals[year] || emptyUsage;
+        }
+
+        function aggregateAllTime() {
+            buildRollupTotals();
+            return allTimeTotals;
+        }
+
+        // Daily usage as parallel typed arrays, one per token type, indexed
+        // by days since firstDate (dayColumns is laid out that way in Python).
+        // A calendar grid is a run of consecutive days, so renders read
+        // neighbouring array slots instead of looking up a date per cell.
+        function daysSinceEpoch(year, month, day) {
+            return Date.UTC(year, month - 1, day) / 86400000;
+        }
+
+        const dayBase = firstDate ? daysSinceEpoch(+firstDate.substring(0, 4), +firstDate.substring(5, 7), +firstDate.substring(8, 10)) : 0;
+        const dayInput = Float64Array.from(dayColumns[0]);
+        const dayOutput = Float64Array.from(dayColumns[1]);
+        const dayCacheRead = Float64Array.from(dayColumns[2]);
+        const dayCacheCreate = Float64Array.from(dayColumns[3]);
+        const dayCount = dayInput.length;
+
+        // Per-day totals, and the peak day for the All Time view, in one pass
+        const dayTotal = new Float64Array(dayCount);
+        let peakAmount = 0;
+        let peakIndex = -1;
+        for (let i = 0; i < dayCount; i++) {
+            const total = dayInput[i] + dayOutput[i] + dayCacheRead[i] + dayCacheCreate[i];
+            dayTotal[i] = total;
+            if (total > peakAmount) {
+                peakAmount = total;
+                peakIndex = i;
+            }
+        }
+        const peakDay = peakIndex >= 0 ? new Date((dayBase + peakIndex) * 86400000).toISOString().substring(0, 10) : '';
+
+        // The All Time view shows the same thing every time, so it is only
+        // rendered once; later visits just show the existing elements.
+        let allTimeRendered = false;
+
+        function renderAllTime() {
+            if (allTimeRendered) return;
+            allTimeRendered = true;
+
             const totals = aggregateAllTime();
             const grandTotal = getTotal(totals);
-            const dates = Object.keys(dailyData).sort();
-            const numDays = dates.length;
-
-            let peakDay = '';
-            let peakAmount = 0;
-            for (const [date, usage] of Object.entries(dailyData)) {{
-                const total = getTotal(usage);
-                if (total > peakAmount) {{
-                    peakAmount = total;
-                    peakDay = date;
-                }}
-            }}
-
             const avgDaily = numDays > 0 ? Math.round(grandTotal / numDays) : 0;
-            const dateRange = dates.length > 0 ? `${{dates[0]}} to ${{dates[dates.length-1]}}` : 'No data';
+            const dateRange = numDays > 0 ? `${firstDate} to ${lastDate}` : 'No data';
 
             // Header with date range
             document.getElementById('all-time-header').innerHTML = `
-                <div class="all-time-date-range">${{dateRange}}</div>
-                <div class="all-time-days-count">${{numDays}} days with data</div>
+                <div class="all-time-date-range">${dateRange}</div>
+                <div class="all-time-days-count">${numDays} days with data</div>
             `;
 
             // Row 1: Total | Avg Daily | Peak Day
             document.getElementById('all-time-stats').innerHTML = `
                 <div class="stat-card">
                     <div class="stat-label">Total Tokens</div>
-                    <div class="stat-value highlight">${{formatTokens(grandTotal)}}</div>
+                    <div class="stat-value highlight">${formatTokens(grandTotal)}</div>
                 </div>
                 <div class="stat-card">
                     <div class="stat-label">Average Daily</div>
-                    <div class="stat-value" style="color: #00d4ff;">${{formatTokens(avgDaily)}}</div>
+                    <div class="stat-value" style="color: #00d4ff;">${formatTokens(avgDaily)}</div>
                 </div>
                 <div class="stat-card">
                     <div class="stat-label">Peak Day</div>
-                    <div class="stat-value" style="color: #00d4ff;">${{formatTokens(peakAmount)}}</div>
-                    <div style="color: #666; font-size: 0.85rem; margin-top: 8px;">${{peakDay}}</div>
+                    <div class="stat-value" style="color: #00d4ff;">${formatTokens(peakAmount)}</div>
+                    <div style="color: #666; font-size: 0.85rem; margin-top: 8px;">${peakDay}</div>
                 </div>
             `;
 
@@ -1026,116 +1507,184 @@ def generate_html(usage_data):
                 <div class="summary-grid">
                     <div class="summary-item">
                         <div class="summary-label">Input Tokens</div>
-                        <div class="summary-value input">${{formatTokens(totals.input_tokens)}}</div>
+                        <div class="summary-value input">${formatTokens(totals.input_tokens)}</div>
                     </div>
                     <div class="summary-item">
                         <div class="summary-label">Output Tokens</div>
-                        <div class="summary-value output">${{formatTokens(totals.output_tokens)}}</div>
+                        <div class="summary-value output">${formatTokens(totals.output_tokens)}</div>
                     </div>
                     <div class="summary-item">
                         <div class="summary-label">Cache Read</div>
-                        <div class="summary-value cache-read">${{formatTokens(totals.cache_read_input_tokens)}}</div>
+                        <div class="summary-value cache-read">${formatTokens(totals.cache_read_input_tokens)}</div>
                     </div>
                     <div class="summary-item">
                         <div class="summary-label">Cache Create</div>
-                        <div class="summary-value cache-create">${{formatTokens(totals.cache_creation_input_tokens)}}</div>
+                        <div class="summary-value cache-create">${formatTokens(totals.cache_creation_input_tokens)}</div>
                     </div>
                     <div class="summary-item">
                         <div class="summary-label">Grand Total</div>
-                        <div class="summary-value total">${{formatTokens(grandTotal)}}</div>
+                        <div class="summary-value total">${formatTokens(grandTotal)}</div>
                     </div>
                 </div>
             `;
-        }}
+        }
 
-        function renderYearly() {{
-            document.getElementById('nav-current').textContent = currentYear;
-            document.getElementById('nav-prev').classList.toggle('disabled', currentYear <= minYear);
-            document.getElementById('nav-next').classList.toggle('disabled', currentYear >= maxYear);
+        // A year's markup depends only on the year, so it is built once per
+        // year and reused when flipping back and forth; the year already on
+        // screen is not re-rendered at all.
+        const yearlyHtml = new Map();
+        let renderedYear = null;
 
-            let html = '';
-            let yearTotal = {{ input_tokens: 0, output_tokens: 0, cache_read_input_tokens: 0, cache_creation_input_tokens: 0 }};
+        function buildYearlyHtml(year) {
+            const parts = [];
+            const yearTotal = aggregateByYear(year);
 
-            for (let m = 1; m <= 12; m++) {{
-                const monthData = aggregateByMonth(currentYear, m);
+            for (let m = 1; m <= 12; m++) {
+                const monthData = aggregateByMonth(year, m);
                 const total = getTotal(monthData);
                 const hasData = total > 0;
 
-                yearTotal.input_tokens += monthData.input_tokens;
-                yearTotal.output_tokens += monthData.output_tokens;
-                yearTotal.cache_read_input_tokens += monthData.cache_read_input_tokens;
-                yearTotal.cache_creation_input_tokens += monthData.cache_creation_input_tokens;
-
-                html += `
-                    <div class="month-card ${{hasData ? '' : 'no-data'}}" data-month="${{m}}" data-year="${{currentYear}}">
-                        <div class="month-name">${{monthNames[m-1]}}</div>
-                        <div class="month-total">${{hasData ? formatTokens(total) : '—'}}</div>
+                parts.push(`
+                    <div class="month-card ${hasData ? '' : 'no-data'}" data-month="${m}" data-year="${year}">
+                        <div class="month-name">${monthNames[m-1]}</div>
+                        <div class="month-total">${hasData ? formatTokens(total) : '—'}</div>
                         <div class="month-breakdown">
-                            <span class="in-label">In: ${{formatTokens(monthData.input_tokens)}}</span>
-                            <span class="out-label">Out: ${{formatTokens(monthData.output_tokens)}}</span>
-                            <span class="cache-r-label">Cache R: ${{formatTokens(monthData.cache_read_input_tokens)}}</span>
-                            <span class="cache-c-label">Cache C: ${{formatTokens(monthData.cache_creation_input_tokens)}}</span>
+                            <span class="in-label">In: ${formatTokens(monthData.input_tokens)}</span>
+                            <span class="out-label">Out: ${formatTokens(monthData.output_tokens)}</span>
+                            <span class="cache-r-label">Cache R: ${formatTokens(monthData.cache_read_input_tokens)}</span>
+                            <span class="cache-c-label">Cache C: ${formatTokens(monthData.cache_creation_input_tokens)}</span>
                         </div>
                     </div>
-                `;
-            }}
-
-            document.getElementById('year-grid').innerHTML = html;
+                `);
+            }
 
             const grandTotal = getTotal(yearTotal);
-            document.getElementById('year-summary').innerHTML = `
-                <h2>${{currentYear}} Yearly Summary</h2>
+            const summary = `
+                <h2>${year} Yearly Summary</h2>
                 <div class="summary-grid">
                     <div class="summary-item">
                         <div class="summary-label">Input Tokens</div>
-                        <div class="summary-value input">${{formatTokens(yearTotal.input_tokens)}}</div>
+                        <div class="summary-value input">${formatTokens(yearTotal.input_tokens)}</div>
                     </div>
                     <div class="summary-item">
                         <div class="summary-label">Output Tokens</div>
-                        <div class="summary-value output">${{formatTokens(yearTotal.output_tokens)}}</div>
+                        <div class="summary-value output">${formatTokens(yearTotal.output_tokens)}</div>
                     </div>
                     <div class="summary-item">
                         <div class="summary-label">Cache Read</div>
-                        <div class="summary-value cache-read">${{formatTokens(yearTotal.cache_read_input_tokens)}}</div>
+                        <div class="summary-value cache-read">${formatTokens(yearTotal.cache_read_input_tokens)}</div>
                     </div>
                     <div class="summary-item">
                         <div class="summary-label">Cache Create</div>
-                        <div class="summary-value cache-create">${{formatTokens(yearTotal.cache_creation_input_tokens)}}</div>
+                        <div class="summary-value cache-create">${formatTokens(yearTotal.cache_creation_input_tokens)}</div>
                     </div>
                     <div class="summary-item">
                         <div class="summary-label">Grand Total</div>
-                        <div class="summary-value total">${{formatTokens(grandTotal)}}</div>
+                        <div class="summary-value total">${formatTokens(grandTotal)}</div>
                     </div>
                 </div>
             `;
 
-            // Add click handlers for month cards
-            document.querySelectorAll('.month-card:not(.no-data)').forEach(card => {{
-                card.addEventListener('click', () => {{
-                    currentMonth = parseInt(card.dataset.month);
-                    currentYear = parseInt(card.dataset.year);
-                    document.querySelector('.nav-tab[data-view="monthly"]').click();
-                }});
-            }});
-        }}
+            return { grid: parts.join(''), summary };
+        }
 
-        function getDaysInMonth(year, month) {{
-            return new Date(year, month, 0).getDate();
-        }}
+        function renderYearly() {
+            navCurrent.textContent = currentYear;
+            navPrev.classList.toggle('disabled', currentYear <= minYear);
+            navNext.classList.toggle('disabled', currentYear >= maxYear);
+            if (renderedYear === currentYear) return;
+            renderedYear = currentYear;
+
+            let html = yearlyHtml.get(currentYear);
+            if (html === undefined) {
+                html = buildYearlyHtml(currentYear);
+                yearlyHtml.set(currentYear, html);
+            }
+            yearGrid.innerHTML = html.grid;
+            yearSummary.innerHTML = html.summary;
+        }
 
-        function getFirstDayOfMonth(year, month) {{
-            // Returns 0=Sun, 1=Mon, etc.
-            return new Date(year, month - 1, 1).getDay();
-        }}
+        // Calendar arithmetic without allocating Dates on every render
+        const monthDays = [31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31];
+        const monthOffsets = [0, 3, 2, 5, 0, 3, 5, 1, 4, 6, 2, 4];
 
-        function renderMonthly() {{
-            document.getElementById('nav-current').textContent = `${{monthNames[currentMonth-1]}} ${{currentYear}}`;
+        function isLeapYear(year) {
+            return (year % 4 === 0 && year % 100 !== 0) || year % 400 === 0;
+        }
+
+        function getDaysInMonth(year, month) {
+            return month === 2 && isLeapYear(year) ? 29 : monthDays[month - 1];
+        }
+
+        function getFirstDayOfMonth(year, month) {
+            // Returns 0=Sun, 1=Mon, etc. (Sakamoto's method)
+            const y = month < 3 ? year - 1 : year;
+            return (y + Math.floor(y / 4) - Math.floor(y / 100) + Math.floor(y / 400) + monthOffsets[month - 1] + 1) % 7;
+        }
+
+        // The monthly grid is made of DOM nodes cloned from templates once
+        // and then updated in place, so moving between months only sets text
+        // and class names instead of re-parsing the whole grid as HTML.
+        // Week rows are created as needed (at most six).
+        const dayCellTemplate = document.createElement('template');
+        dayCellTemplate.innerHTML = '<div class="day-cell"><div class="day-header"><span class="day-total"></span><span class="day-number"></span></div><div class="day-breakdown"><span class="in-label">&nbsp;</span><span class="out-label">&nbsp;</span><span class="cache-r-label">&nbsp;</span><span class="cache-c-label">&nbsp;</span></div></div>';
+        const weekTotalTemplate = document.createElement('template');
+        weekTotalTemplate.innerHTML = '<div class="week-total"><div class="week-total-label">Week Total</div><div class="week-total-value"></div></div>';
+
+        const monthlyHeader = document.createElement('div');
+        monthlyHeader.className = 'calendar-header';
+        monthlyHeader.innerHTML = ['Sun', 'Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Weekly']
+            .map(name => `<div class="header-cell">${name}</div>`).join('');
+        const monthlySummary = document.createElement('div');
+        monthlySummary.className = 'summary';
+        const weekRows = [];
+
+        function createWeekRow() {
+            const root = document.createElement('div');
+            root.className = 'week-row';
+            const cells = [];
+            for (let dow = 0; dow < 7; dow++) {
+                const cell = dayCellTemplate.content.firstElementChild.cloneNode(true);
+                const [header, breakdown] = cell.children;
+                cells.push({
+                    root: cell,
+                    total: header.children[0],
+                    number: header.children[1],
+                    input: breakdown.children[0],
+                    output: breakdown.children[1],
+                    cacheRead: breakdown.children[2],
+                    cacheCreate: breakdown.children[3],
+                    filled: false,
+                });
+                root.appendChild(cell);
+            }
+            const weekTotal = weekTotalTemplate.content.firstElementChild.cloneNode(true);
+            root.appendChild(weekTotal);
+            return { root, cells, weekTotal: weekTotal.children[1] };
+        }
+
+        // Cells are reused across renders, so a breakdown that is about to be
+        // hidden is blanked rather than left holding another day's numbers.
+        // The blanks are non-breaking spaces, which keep each line's height.
+        const blankLine = '\\u00a0';
+
+        function clearBreakdown(cell) {
+            if (!cell.filled) return;
+            cell.filled = false;
+            cell.input.textContent = blankLine;
+            cell.output.textContent = blankLine;
+            cell.cacheRead.textContent = blankLine;
+            cell.cacheCreate.textContent = blankLine;
+        }
+
+        function renderMonthly() {
+            navCurrent.textContent = `${monthNames[currentMonth-1]} ${currentYear}`;
 
             // Determine if we can go prev/next
             const canPrev = currentYear > minYear || (currentYear === minYear && currentMonth > 1);
             const canNext = currentYear < maxYear || (currentYear === maxYear && currentMonth < 12);
-            document.getElementById('nav-prev').classList.toggle('disabled', !canPrev);
-            document.getElementById('nav-next').classList.toggle('disabled', !canNext);
+            navPrev.classList.toggle('disabled', !canPrev);
+            navNext.classList.toggle('disabled', !canNext);
 
             const daysInMonth = getDaysInMonth(currentYear, currentMonth);
             const firstDay = getFirstDayOfMonth(currentYear, currentMonth);
@@ -1145,305 +1694,387 @@ def generate_html(usage_data):
             const prevYear = currentMonth === 1 ? currentYear - 1 : currentYear;
             const daysInPrevMonth = getDaysInMonth(prevYear, prevMonth);
 
-            // Next month info
-            const nextMonth = currentMonth === 12 ? 1 : currentMonth + 1;
-            const nextYear = currentMonth === 12 ? currentYear + 1 : currentYear;
+            // Typed-array slot of the grid's first cell (the Sunday on or
+            // before the 1st) and of the 1st itself; slots outside
+            // [0, dayCount) have no data
+            const monthStart = daysSinceEpoch(currentYear, currentMonth, 1) - dayBase;
+            const gridStart = monthStart - firstDay;
 
-            // Find max for intensity scaling
+            // Max over this month's days, for intensity scaling
             let maxTotal = 0;
-            for (let d = 1; d <= daysInMonth; d++) {{
-                const dateKey = `${{currentYear}}-${{String(currentMonth).padStart(2,'0')}}-${{String(d).padStart(2,'0')}}`;
-                const usage = dailyData[dateKey] || {{}};
-                const total = getTotal(usage);
-                if (total > maxTotal) maxTotal = total;
-            }}
+            const monthEnd = Math.min(monthStart + daysInMonth, dayCount);
+            for (let i = Math.max(monthStart, 0); i < monthEnd; i++) {
+                if (dayTotal[i] > maxTotal) maxTotal = dayTotal[i];
+            }
             if (maxTotal === 0) maxTotal = 1;
-
-            let html = `
-                <div class="calendar-header">
-                    <div class="header-cell">Sun</div>
-                    <div class="header-cell">Mon</div>
-                    <div class="header-cell">Tue</div>
-                    <div class="header-cell">Wed</div>
-                    <div class="header-cell">Thu</div>
-                    <div class="header-cell">Fri</div>
-                    <div class="header-cell">Sat</div>
-                    <div class="header-cell">Weekly</div>
-                </div>
-            `;
-
-            let day = 1;
-            let nextMonthDay = 1;
-            let monthlyTotals = {{ input_tokens: 0, output_tokens: 0, cache_read_input_tokens: 0, cache_creation_input_tokens: 0 }};
+            const monthlyTotals = aggregateByMonth(currentYear, currentMonth);
 
             // Calculate number of weeks needed
             const totalCells = firstDay + daysInMonth;
             const numWeeks = Math.ceil(totalCells / 7);
+            while (weekRows.length < numWeeks) weekRows.push(createWeekRow());
+
+            let day = 1;
+            let nextMonthDay = 1;
 
-            // Generate weeks
-            for (let week = 0; week < numWeeks; week++) {{
-                html += '<div class="week-row">';
+            // Fill in the weeks
+            for (let week = 0; week < numWeeks; week++) {
+                const row = weekRows[week];
                 let weekTotal = 0;
 
-                for (let dow = 0; dow < 7; dow++) {{
+                for (let dow = 0; dow < 7; dow++) {
                     const cellIndex = week * 7 + dow;
+                    const i = gridStart + cellIndex;
+                    const hasSlot = i >= 0 && i < dayCount;
+                    const total = hasSlot ? dayTotal[i] : 0;
+                    let dayNumber, cellClass;
+                    let inMonth = false;
 
-                    if (cellIndex < firstDay) {{
+                    if (cellIndex < firstDay) {
                         // Previous month days
-                        const prevDay = daysInPrevMonth - firstDay + 1 + cellIndex;
-                        const dateKey = `${{prevYear}}-${{String(prevMonth).padStart(2,'0')}}-${{String(prevDay).padStart(2,'0')}}`;
-                        const usage = dailyData[dateKey] || {{ input_tokens: 0, output_tokens: 0, cache_read_input_tokens: 0, cache_creation_input_tokens: 0 }};
-                        const total = getTotal(usage);
-                        weekTotal += total;
-
-                        html += `
-                            <div class="day-cell other-month intensity-low">
-                                <div class="day-header">
-                                    <span class="day-total">${{formatTokens(total)}}</span>
-                                    <span class="day-number">${{prevDay}}</span>
-                                </div>
-                                <div class="day-breakdown">
-                                    <span class="in-label">In: ${{formatTokens(usage.input_tokens || 0)}}</span>
-                                    <span class="out-label">Out: ${{formatTokens(usage.output_tokens || 0)}}</span>
-                                    <span class="cache-r-label">CR: ${{formatTokens(usage.cache_read_input_tokens || 0)}}</span>
-                                    <span class="cache-c-label">CC: ${{formatTokens(usage.cache_creation_input_tokens || 0)}}</span>
-                                </div>
-                            </div>
-                        `;
-                    }} else if (day <= daysInMonth) {{
+                        dayNumber = daysInPrevMonth - firstDay + 1 + cellIndex;
+                        cellClass = 'day-cell other-month intensity-low';
+                    } else if (day <= daysInMonth) {
                         // Current month days
-                        const dateKey = `${{currentYear}}-${{String(currentMonth).padStart(2,'0')}}-${{String(day).padStart(2,'0')}}`;
-                        const usage = dailyData[dateKey] || {{ input_tokens: 0, output_tokens: 0, cache_read_input_tokens: 0, cache_creation_input_tokens: 0 }};
-                        const total = getTotal(usage);
-                        weekTotal += total;
-
-                        monthlyTotals.input_tokens += usage.input_tokens || 0;
-                        monthlyTotals.output_tokens += usage.output_tokens || 0;
-                        monthlyTotals.cache_read_input_tokens += usage.cache_read_input_tokens || 0;
-                        monthlyTotals.cache_creation_input_tokens += usage.cache_creation_input_tokens || 0;
-
+                        dayNumber = day++;
+                        inMonth = true;
                         const intensity = total > 0 ? Math.min(5, Math.ceil((total / maxTotal) * 5)) : 0;
-                        const intensityClass = intensity > 0 ? `intensity-${{intensity}}` : 'intensity-low';
-
-                        html += `
-                            <div class="day-cell ${{intensityClass}}">
-                                <div class="day-header">
-                                    <span class="day-total">${{formatTokens(total)}}</span>
-                                    <span class="day-number">${{day}}</span>
-                                </div>
-                                <div class="day-breakdown">
-                                    <span class="in-label">In: ${{formatTokens(usage.input_tokens || 0)}}</span>
-                                    <span class="out-label">Out: ${{formatTokens(usage.output_tokens || 0)}}</span>
-                                    <span class="cache-r-label">CR: ${{formatTokens(usage.cache_read_input_tokens || 0)}}</span>
-                                    <span class="cache-c-label">CC: ${{formatTokens(usage.cache_creation_input_tokens || 0)}}</span>
-                                </div>
-                            </div>
-                        `;
-                        day++;
-                    }} else {{
+                        cellClass = intensity > 0 ? `day-cell intensity-${intensity}` : 'day-cell intensity-low';
+                    } else {
                         // Next month days
-                        const dateKey = `${{nextYear}}-${{String(nextMonth).padStart(2,'0')}}-${{String(nextMonthDay).padStart(2,'0')}}`;
-                        const usage = dailyData[dateKey] || {{ input_tokens: 0, output_tokens: 0, cache_read_input_tokens: 0, cache_creation_input_tokens: 0 }};
-                        const total = getTotal(usage);
-                        weekTotal += total;
-
-                        html += `
-                            <div class="day-cell other-month intensity-low">
-                                <div class="day-header">
-                                    <span class="day-total">${{formatTokens(total)}}</span>
-                                    <span class="day-number">${{nextMonthDay}}</span>
-                                </div>
-                                <div class="day-breakdown">
-                                    <span class="in-label">In: ${{formatTokens(usage.input_tokens || 0)}}</span>
-                                    <span class="out-label">Out: ${{formatTokens(usage.output_tokens || 0)}}</span>
-                                    <span class="cache-r-label">CR: ${{formatTokens(usage.cache_read_input_tokens || 0)}}</span>
-                                    <span class="cache-c-label">CC: ${{formatTokens(usage.cache_creation_input_tokens || 0)}}</span>
-                                </div>
-                            </div>
-                        `;
-                        nextMonthDay++;
-                    }}
-                }}
-
-                html += `
-                    <div class="week-total">
-                        <div class="week-total-label">Week Total</div>
-                        <div class="week-total-value">${{formatTokens(weekTotal)}}</div>
-                    </div>
-                </div>`;
-            }}
+                        dayNumber = nextMonthDay++;
+                        cellClass = 'day-cell other-month intensity-low';
+                    }
+                    weekTotal += total;
+
+                    const cell = row.cells[dow];
+                    cell.total.textContent = formatTokens(total);
+                    cell.number.textContent = dayNumber;
+                    if (total === 0) {
+                        // Most days are empty: hide the breakdown rather than
+                        // filling it with zeros
+                        cell.root.className = cellClass + ' no-usage';
+                        clearBreakdown(cell);
+                        continue;
+                    }
+                    cell.root.className = cellClass;
+                    // Neighbouring months' days only show their total
+                    if (!inMonth) {
+                        clearBreakdown(cell);
+                        continue;
+                    }
+                    cell.filled = true;
+                    cell.input.textContent = `In: ${formatTokens(dayInput[i])}`;
+                    cell.output.textContent = `Out: ${formatTokens(dayOutput[i])}`;
+                    cell.cacheRead.textContent = `CR: ${formatTokens(dayCacheRead[i])}`;
+                    cell.cacheCreate.textContent = `CC: ${formatTokens(dayCacheCreate[i])}`;
+                }
+
+                row.weekTotal.textContent = formatTokens(weekTotal);
+            }
 
             const grandTotal = getTotal(monthlyTotals);
-            html += `
-                <div class="summary">
-                    <h2>${{monthNames[currentMonth-1]}} ${{currentYear}} Summary</h2>
+            monthlySummary.innerHTML = `
+                    <h2>${monthNames[currentMonth-1]} ${currentYear} Summary</h2>
                     <div class="summary-grid">
                         <div class="summary-item">
                             <div class="summary-label">Input Tokens</div>
-                            <div class="summary-value input">${{formatTokens(monthlyTotals.input_tokens)}}</div>
+                            <div class="summary-value input">${formatTokens(monthlyTotals.input_tokens)}</div>
                         </div>
                         <div class="summary-item">
                             <div class="summary-label">Output Tokens</div>
-                            <div class="summary-value output">${{formatTokens(monthlyTotals.output_tokens)}}</div>
+                            <div class="summary-value output">${formatTokens(monthlyTotals.output_tokens)}</div>
                         </div>
                         <div class="summary-item">
                             <div class="summary-label">Cache Read</div>
-                            <div class="summary-value cache-read">${{formatTokens(monthlyTotals.cache_read_input_tokens)}}</div>
+                            <div class="summary-value cache-read">${formatTokens(monthlyTotals.cache_read_input_tokens)}</div>
                         </div>
                         <div class="summary-item">
                             <div class="summary-label">Cache Create</div>
-                            <div class="summary-value cache-create">${{formatTokens(monthlyTotals.cache_creation_input_tokens)}}</div>
+                            <div class="summary-value cache-create">${formatTokens(monthlyTotals.cache_creation_input_tokens)}</div>
                         </div>
                         <div class="summary-item">
                             <div class="summary-label">Grand Total</div>
-                            <div class="summary-value total">${{formatTokens(grandTotal)}}</div>
+                            <div class="summary-value total">${formatTokens(grandTotal)}</div>
                         </div>
                     </div>
-                </div>
             `;
 
-            document.getElementById('monthly-calendar').innerHTML = html;
-        }}
-
-        function switchView(view) {{
-            currentView = view;
-
-            document.querySelectorAll('.nav-tab').forEach(t => t.classList.remove('active'));
-            document.querySelector(`.nav-tab[data-view="${{view}}"]`).classList.add('active');
+            monthlyCalendar.replaceChildren(
+                monthlyHeader, ...weekRows.slice(0, numWeeks).map(row => row.root), monthlySummary);
+        }
 
-            document.querySelectorAll('.view-content').forEach(v => v.classList.remove('active'));
-            document.getElementById(`view-${{view}}`).classList.add('active');
+        // Renders are deferred to the next animation frame: a burst of
+        // navigation (say, holding down j or l) then costs one render per
+        // frame, of the latest state, instead of one per keypress.
+        let renderFrame = 0;
 
-            const subNav = document.getElementById('sub-nav');
-            if (view === 'alltime') {{
-                subNav.style.display = 'none';
+        function renderCurrentView() {
+            renderFrame = 0;
+            if (currentView === 'alltime') {
                 renderAllTime();
-            }} else if (view === 'yearly') {{
-                subNav.style.display = 'flex';
+            } else if (currentView === 'yearly') {
                 renderYearly();
-            }} else if (view === 'monthly') {{
-                subNav.style.display = 'flex';
+            } else if (currentView === 'monthly') {
                 renderMonthly();
-            }}
-        }}
+            }
+        }
+
+        function scheduleRender() {
+            if (!renderFrame) renderFrame = requestAnimationFrame(renderCurrentView);
+        }
+
+        function switchView(view) {
+            currentView = view;
+
+            navTabs.forEach(t => t.classList.toggle('active', t.dataset.view === view));
+            viewContents.forEach(v => v.classList.toggle('active', v.id === `view-${view}`));
+
+            subNav.style.display = view === 'alltime' ? 'none' : 'flex';
+            scheduleRender();
+        }
 
         // Event listeners
-        document.querySelectorAll('.nav-tab').forEach(tab => {{
+        navTabs.forEach(tab => {
             tab.addEventListener('click', () => switchView(tab.dataset.view));
-        }});
+        });
+
+        // One delegated handler for the month cards, which are re-created on
+        // every yearly render
+        yearGrid.addEventListener('click', (e) => {
+            const card = e.target.closest('.month-card:not(.no-data)');
+            if (!card) return;
+            currentMonth = parseInt(card.dataset.month);
+            currentYear = parseInt(card.dataset.year);
+            switchView('monthly');
+        });
 
-        document.getElementById('nav-prev').addEventListener('click', () => {{
-            if (currentView === 'yearly' && currentYear > minYear) {{
+        // Navigation only updates the current year/month and schedules a
+        // render, so key repeats between frames collapse into one render.
+        function navigatePrev() {
+            if (currentView === 'yearly' && currentYear > minYear) {
                 currentYear--;
-                renderYearly();
-            }} else if (currentView === 'monthly') {{
+                scheduleRender();
+            } else if (currentView === 'monthly') {
                 currentMonth--;
-                if (currentMonth < 1) {{
+                if (currentMonth < 1) {
                     currentMonth = 12;
                     currentYear--;
-                }}
-                renderMonthly();
-            }}
-        }});
+                }
+                scheduleRender();
+            }
+        }
 
-        document.getElementById('nav-next').addEventListener('click', () => {{
-            if (currentView === 'yearly' && currentYear < maxYear) {{
+        function navigateNext() {
+            if (currentView === 'yearly' && currentYear < maxYear) {
                 currentYear++;
-                renderYearly();
-            }} else if (currentView === 'monthly') {{
+                scheduleRender();
+            } else if (currentView === 'monthly') {
                 currentMonth++;
-                if (currentMonth > 12) {{
+                if (currentMonth > 12) {
                     currentMonth = 1;
                     currentYear++;
-                }}
-                renderMonthly();
-            }}
-        }});
+                }
+                scheduleRender();
+            }
+        }
+
+        navPrev.addEventListener('click', navigatePrev);
+        navNext.addEventListener('click', navigateNext);
 
         // Initial render
         switchView('monthly');
+        if (window.requestIdleCallback) requestIdleCallback(buildRollupTotals, { timeout: 500 });
 
         // Keyboard shortcuts
         const helpModal = document.getElementById('help-modal');
         const protip = document.getElementById('protip');
 
-        function showHelp() {{
+        function showHelp() {
             helpModal.classList.add('active');
             protip.classList.add('hidden');
-        }}
+        }
 
-        function hideHelp() {{
+        function hideHelp() {
             helpModal.classList.remove('active');
-        }}
-
-        function navigatePrev() {{
-            document.getElementById('nav-prev').click();
-        }}
-
-        function navigateNext() {{
-            document.getElementById('nav-next').click();
-        }}
+        }
 
-        function goToCurrentMonth() {{
+        function goToCurrentMonth() {
             // Reset to the latest month with data
-            const dates = Object.keys(dailyData).sort();
-            if (dates.length > 0) {{
-                const latestDate = dates[dates.length - 1];
-                currentYear = parseInt(latestDate.substring(0, 4));
-                currentMonth = parseInt(latestDate.substring(5, 7));
-            }}
+            currentYear = maxYear;
+            currentMonth = latestMonth;
             switchView('monthly');
-        }}
+        }
+
+        // Shortcut key -> action (no prototype, so only these keys match)
+        const keyActions = Object.freeze({
+            __proto__: null,
+            '?': showHelp,
+            '1': () => switchView('monthly'),
+            '2': () => switchView('yearly'),
+            '3': () => switchView('alltime'),
+            'h': navigatePrev,
+            'k': navigatePrev,
+            'j': navigateNext,
+            'l': navigateNext,
+            'c': goToCurrentMonth,
+        });
+
+        document.addEventListener('keydown', (e) => {
+            const key = e.key;
+            const action = keyActions[key];
+            // Keys without a shortcut return before any other checks
+            if (!action && key !== 'Escape') return;
 
-        document.addEventListener('keydown', (e) => {{
             // Ignore if typing in an input
             if (e.target.tagName === 'INPUT' || e.target.tagName === 'TEXTAREA') return;
 
-            const key = e.key;
-
-            if (key === 'Escape') {{
+            if (key === 'Escape') {
                 hideHelp();
                 return;
-            }}
+            }
 
             if (helpModal.classList.contains('active')) return;
 
-            switch (key) {{
-                case '?':
-                    showHelp();
-                    break;
-                case '1':
-                    switchView('monthly');
-                    break;
-                case '2':
-                    switchView('yearly');
-                    break;
-                case '3':
-                    switchView('alltime');
-                    break;
-                case 'h':
-                case 'k':
-                    navigatePrev();
-                    break;
-                case 'j':
-                case 'l':
-                    navigateNext();
-                    break;
-                case 'c':
-                    goToCurrentMonth();
-                    break;
-            }}
-        }});
+            action();
+        });
 
         // Close modal when clicking overlay
-        helpModal.addEventListener('click', (e) => {{
+        helpModal.addEventListener('click', (e) => {
             if (e.target === helpModal) hideHelp();
-        }});
-    </script>
+        });
+"""
+
+
+def write_html(usage_data, out, stylesheet_href=None):
+    """Write interactive HTML with all views to the binary file object out.
+
+    The page is written in UTF-8 pieces around the embedded usage data, which
+    is serialized straight to bytes, so the (potentially large) JSON is never
+    copied into one big page string or encoded twice. Daily usage goes in as
+    dense columns (see daily_columns) plus monthly rollups.
+    If stylesheet_href is given the page links to that stylesheet instead
+    of embedding HTML_STYLE.
+    """
+    # Extract data from the canonical structure
+    daily_usage = usage_data["daily_usage"]
+    tz_label = usage_data["timezone"]
+    date_range = usage_data["date_range"]
+
+    # Find date range
+    if date_range["start"]:
+        min_date = date_range["start"]
+        max_date = date_range["end"]
+        min_year = int(min_date[:4])
+        max_year = int(max_date[:4])
+        columns = daily_columns(daily_usage, min_date, max_date)
+        first_date, last_date = min_date, max_date
+    else:
+        columns = [[], [], [], []]
+        first_date = last_date = ""
+        now = datetime.now()
+        min_year = max_year = now.year
+        min_date = max_date = now.strftime("%Y-%m-%d")
+
+    # The page opens on the latest month with data
+    latest_month = int(max_date[5:7])
+
+    if stylesheet_href:
+        style = f'    <link rel="stylesheet" href="{escape(stylesheet_href)}">\n'
+    else:
+        style = f"    <style>\n{HTML_STYLE}    </style>\n"
+
+    write = out.write
+    write(f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Claude Code Token Usage</title>
+{style}</head>
+<body>
+    <div class="protip" id="protip">protip: press <kbd>?</kbd> for keyboard shortcuts</div>
+    <div class="container">
+        <div class="header-bar">
+            <h1>Claude Code Token Usage</h1>
+            <div class="nav-tabs">
+                <div class="nav-tab active" data-view="monthly">📆 Monthly</div>
+                <div class="nav-tab" data-view="yearly">📅 Yearly</div>
+                <div class="nav-tab" data-view="alltime">📊 All Time</div>
+            </div>
+            <div class="tz-label">{tz_label}</div>
+        </div>
+
+        <div class="sub-nav" id="sub-nav" style="display: none;">
+            <div class="nav-arrow" id="nav-prev">◀</div>
+            <div class="nav-current" id="nav-current"></div>
+            <div class="nav-arrow" id="nav-next">▶</div>
+        </div>
+
+        <div class="view-content" id="view-alltime">
+            <div class="calendar">
+                <div class="all-time-header" id="all-time-header"></div>
+                <div class="all-time-stats" id="all-time-stats"></div>
+                <div class="summary" id="all-time-summary"></div>
+            </div>
+        </div>
+
+        <div class="view-content" id="view-yearly">
+            <div class="calendar">
+                <div class="year-grid" id="year-grid"></div>
+                <div class="summary" id="year-summary"></div>
+            </div>
+        </div>
+
+        <div class="view-content active" id="view-monthly">
+            <div class="calendar" id="monthly-calendar"></div>
+        </div>
+    </div>
+
+    <div class="modal-overlay" id="help-modal">
+        <div class="modal">
+            <h3>Keyboard Shortcuts</h3>
+            <div class="modal-hint">press esc to close</div>
+            <div class="modal-divider"></div>
+            <table class="shortcut-table">
+                <tr><td><kbd>1</kbd></td><td>Monthly view</td></tr>
+                <tr><td><kbd>2</kbd></td><td>Yearly view</td></tr>
+                <tr><td><kbd>3</kbd></td><td>All Time view</td></tr>
+                <tr><td><kbd>h</kbd> / <kbd>k</kbd></td><td>Previous (month/year)</td></tr>
+                <tr><td><kbd>j</kbd> / <kbd>l</kbd></td><td>Next (month/year)</td></tr>
+                <tr><td><kbd>c</kbd></td><td>Current month</td></tr>
+                <tr><td><kbd>?</kbd></td><td>Show this help</td></tr>
+            </table>
+            <div class="modal-divider"></div>
+            <a href="https://github.com/rickgorman/claude-usage-calendar" target="_blank" class="github-link">
+                <svg viewBox="0 0 16 16"><path d="M8 0C3.58 0 0 3.58 0 8c0 3.54 2.29 6.53 5.47 7.59.4.07.55-.17.55-.38 0-.19-.01-.82-.01-1.49-2.01.37-2.53-.49-2.69-.94-.09-.23-.48-.94-.82-1.13-.28-.15-.68-.52-.01-.53.63-.01 1.08.58 1.23.82.72 1.21 1.87.87 2.33.66.07-.52.28-.87.51-1.07-1.78-.2-3.64-.89-3.64-3.95 0-.87.31-1.59.82-2.15-.08-.2-.36-1.02.08-2.12 0 0 .67-.21 2.2.82.64-.18 1.32-.27 2-.27.68 0 1.36.09 2 .27 1.53-1.04 2.2-.82 2.2-.82.44 1.1.16 1.92.08 2.12.51.56.82 1.27.82 2.15 0 3.07-1.87 3.75-3.65 3.95.29.25.54.73.54 1.48 0 1.07-.01 1.93-.01 2.2 0 .21.15.46.55.38A8.013 8.013 0 0016 8c0-4.42-3.58-8-8-8z"/></svg>
+                rickgorman/claude-usage-calendar
+            </a>
+        </div>
+    </div>
+
+    <script>
+        const dayColumns = """.encode())
+    if orjson:
+        dumps = orjson.dumps
+    else:
+        dumps = lambda obj: json.dumps(obj, separators=(",", ":")).encode()
+    write(dumps(columns))
+    write(b";\n        const monthlyData = ")
+    write(dumps(monthly_usage(daily_usage)))
+    write(f""";
+        const firstDate = "{first_date}";
+        const lastDate = "{last_date}";
+        const numDays = {len(daily_usage)};
+        const minYear = {min_year};
+        const maxYear = {max_year};
+        const latestMonth = {latest_month};
+""".encode())
+    write(HTML_SCRIPT.encode())
+    write("""    </script>
 </body>
 </html>
-"""
-    return html
+""".encode())
 
 
 def main():
@@ -1501,12 +2132,29 @@ Notes:
     parser.add_argument(
         "--no-open", action="store_true", help="Don't open the HTML file in browser"
     )
+    parser.add_argument(
+        "--external-css",
+        action="store_true",
+        help="Write the stylesheet to a .css file next to the output and link it",
+    )
     parser.add_argument(
         "--search-path",
         type=str,
         default="~/",
         help="Path to search for JSONL files (default: ~/)",
     )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=None,
+        help="Number of parallel parser processes (default: CPU count)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"Parse every file again instead of reusing results cached in {CACHE_DIR}",
+    )
     parser.add_argument("--quiet", "-q", action="store_true", help="Suppress output")
     parser.add_argument(
         "--json", action="store_true", help="Output JSON data instead of HTML calendar"
@@ -1538,7 +2186,8 @@ Notes:
         print(f"Found {len(files)} files matching UUID/agent pattern")
         print("Parsing usage data...")
 
-    daily_usage, msg_count = parse_jsonl_files(files, tz)
+    cache_dir = None if args.no_cache else CACHE_DIR
+    daily_usage, msg_count = parse_jsonl_files(files, tz, args.jobs, cache_dir)
 
     if not args.quiet:
         print(f"Found {msg_count} unique messages across {len(daily_usage)} days")
@@ -1548,16 +2197,28 @@ Notes:
 
     # JSON output mode
     if args.json:
-        print(json.dumps(usage_data, indent=2))
+        # One write of the fully serialized document
+        if orjson:
+            sys.stdout.flush()
+            sys.stdout.buffer.write(
+                orjson.dumps(usage_data, option=orjson.OPT_INDENT_2) + b"\n"
+            )
+        else:
+            sys.stdout.write(json.dumps(usage_data, indent=2) + "\n")
         return
 
     if not args.quiet:
         print("Generating interactive HTML...")
 
-    html = generate_html(usage_data)
+    stylesheet_href = None
+    if args.external_css:
+        css_path = os.path.splitext(args.output)[0] + ".css"
+        with open(css_path, "w", encoding="utf-8") as f:
+            f.write(HTML_STYLE)
+        stylesheet_href = os.path.basename(css_path)
 
-    with open(args.output, "w") as f:
-        f.write(html)
+    with open(args.output, "wb") as f:
+        write_html(usage_data, f, stylesheet_href)
 
     if not args.quiet:
         print(f"Saved to {args.output}")